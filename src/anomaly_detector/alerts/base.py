@@ -33,6 +33,9 @@ class AlertChannel(abc.ABC):
     async def send(self, alert: Alert) -> None:
         """Deliver the given alert."""
 
+    async def aclose(self) -> None:  # noqa: B027 - optional hook, a no-op by default
+        """Release any connections held by the channel."""
+
 
 class AlertDispatcher:
     """Dispatch alerts to multiple channels with basic error isolation."""
@@ -46,3 +49,7 @@ class AlertDispatcher:
                 await channel.send(alert)
             except Exception:  # pragma: no cover - defensive catch, logged upstream
                 continue
+
+    async def aclose(self) -> None:
+        for channel in self._channels:
+            await channel.aclose()
@@ -2,12 +2,29 @@
 
 from __future__ import annotations
 
-import smtplib
+import asyncio
 from email.message import EmailMessage
 
+import aiosmtplib
+
 from anomaly_detector.alerts.base import Alert, AlertChannel
 from anomaly_detector.config import get_settings
 
+_BODY_TEMPLATE = (
+    "Alert: {title}\n"
+    "Severity: {severity}\n"
+    "Source: {source} -> {destination}\n"
+    "Protocol: {protocol}\n"
+)
+
+# Only a dropped session is worth a fresh connection; refusals and data errors would
+# fail the same way again, and a timeout after DATA may already have delivered the alert.
+_RECONNECT_ERRORS = (
+    aiosmtplib.SMTPServerDisconnected,
+    aiosmtplib.SMTPConnectError,
+    ConnectionError,
+)
+
 
 class SMTPEmailChannel(AlertChannel):
     """Send alerts via SMTP email."""
@@ -20,6 +37,9 @@ class SMTPEmailChannel(AlertChannel):
         self._username = settings.smtp_username
         self._password = settings.smtp_password
         self._sender = settings.smtp_from
+        # One SMTP session is reused across alerts; the lock serializes access to it.
+        self._client: aiosmtplib.SMTP | None = None
+        self._lock = asyncio.Lock()
 
     async def send(self, alert: Alert) -> None:
         if not self._host or not self._sender:
@@ -30,23 +50,64 @@ class SMTPEmailChannel(AlertChannel):
         msg["From"] = self._sender
         msg["To"] = self._sender
         msg.set_content(
-            (
-                f"Alert: {alert.title}\n"
-                f"Severity: {alert.severity}\n"
-                f"Source: {alert.event.source_ip} -> {alert.event.destination_ip}\n"
-                f"Protocol: {alert.event.protocol}\n"
+            _BODY_TEMPLATE.format(
+                title=alert.title,
+                severity=alert.severity,
+                source=alert.event.source_ip,
+                destination=alert.event.destination_ip,
+                protocol=alert.event.protocol,
             )
         )
 
-        loop = __import__("asyncio").get_event_loop()
-        await loop.run_in_executor(None, self._send_email_sync, msg)
-
-    def _send_email_sync(self, message: EmailMessage) -> None:
-        if self._username and self._password:
-            with smtplib.SMTP(self._host, self._port or 587) as server:
-                server.starttls()
-                server.login(self._username, self._password)
-                server.send_message(message)
-        else:
-            with smtplib.SMTP(self._host, self._port or 25) as server:
-                server.send_message(message)
+        async with self._lock:
+            client = await self._get_client()
+            try:
+                await client.send_message(msg)
+            except _RECONNECT_ERRORS:
+                self._discard_client()
+                client = await self._get_client()
+                await client.send_message(msg)
+
+    async def _get_client(self) -> aiosmtplib.SMTP:
+        client = self._client
+        if client is not None and client.is_connected:
+            try:
+                # noop() raises SMTPResponseException on anything but a 250 reply.
+                await client.noop()
+                return client
+            except (aiosmtplib.SMTPException, ConnectionError):
+                pass
+        self._discard_client()
+
+        username, password = self._username, self._password
+        default_port = 587 if username and password else 25
+        client = aiosmtplib.SMTP(
+            hostname=self._host, port=self._port or default_port, start_tls=False
+        )
+        try:
+            await client.connect()
+            if username and password:
+                await client.starttls()
+                await client.login(username, password)
+        except BaseException:
+            client.close()
+            raise
+        self._client = client
+        return client
+
+    def _discard_client(self) -> None:
+        client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+    async def aclose(self) -> None:
+        """Terminate the pooled SMTP session, if any."""
+
+        async with self._lock:
+            client, self._client = self._client, None
+        if client is None or not client.is_connected:
+            return
+        try:
+            await client.quit()
+        except Exception:  # pragma: no cover - best effort on shutdown
+            client.close()
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
-import json
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+import orjson
 
 from anomaly_detector.alerts.base import Alert, AlertChannel
 from anomaly_detector.config import get_settings
 
+if TYPE_CHECKING:
+    import httpx
+
 
 class SlackWebhookChannel(AlertChannel):
     """Deliver alerts to Slack via incoming webhook."""
@@ -16,6 +20,7 @@ class SlackWebhookChannel(AlertChannel):
         super().__init__(name="slack")
         settings = get_settings()
         self._webhook_url = webhook_url or settings.slack_webhook_url
+        self._client: httpx.AsyncClient | None = None
 
     async def send(self, alert: Alert) -> None:
         if not self._webhook_url:
@@ -39,9 +44,27 @@ class SlackWebhookChannel(AlertChannel):
             ],
         }
 
-        # Lazy import to avoid hard dependency at startup when Slack not configured.
-        import httpx
+        client = await self._get_client()
+        response = await client.post(
+            self._webhook_url,
+            content=orjson.dumps(payload),
+            headers={"content-type": "application/json"},
+        )
+        response.raise_for_status()
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            # Lazy import to avoid hard dependency at startup when Slack not configured.
+            import httpx
+
+            self._client = httpx.AsyncClient(
+                timeout=5.0,
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=4),
+            )
+        return self._client
 
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.post(self._webhook_url, content=json.dumps(payload))
-            response.raise_for_status()
+    async def aclose(self) -> None:
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
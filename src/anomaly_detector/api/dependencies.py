@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-from functools import lru_cache
-
 from anomaly_detector.storage.repository import InMemoryAnomalyRepository
 
+_REPOSITORY: InMemoryAnomalyRepository | None = None
+
 
-@lru_cache()
 def get_anomaly_repository() -> InMemoryAnomalyRepository:
-    return InMemoryAnomalyRepository()
+    global _REPOSITORY
+    if _REPOSITORY is None:
+        _REPOSITORY = InMemoryAnomalyRepository()
+    return _REPOSITORY
@@ -4,9 +4,12 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import itertools
 import json
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, Iterator
+
+import ijson
 
 from anomaly_detector.pipeline.detection import PortScanHeuristicDetector
 from anomaly_detector.pipeline.processor import PipelineProcessor
@@ -14,17 +17,45 @@ from anomaly_detector.alerts.base import AlertDispatcher
 from anomaly_detector.pipeline.enrichment import NoOpEnricher
 from anomaly_detector.api.dependencies import get_anomaly_repository
 
+# Events are scored in batches so detectors take their vectorized evaluate_many path;
+# a few batches run concurrently to overlap enrichment and alert I/O.
+INGEST_BATCH_SIZE = 256
+INGEST_CONCURRENCY = 8
+
+
+def iter_events_from_file(path: Path) -> Iterator[dict[str, Any]]:
+    """Stream events from a JSON array file without materializing the whole list.
+
+    The array check runs eagerly, so malformed input fails before any event is processed.
+    """
+
+    file = path.open("rb")
+    try:
+        parser = ijson.parse(file, use_float=True)
+        try:
+            first = next(parser, None)
+        except ijson.JSONError as exc:
+            # Keep the ValueError contract json.load gave callers for unparseable input.
+            raise ValueError("Input file must contain a JSON array of events") from exc
+        if first is None or first[1] != "start_array":
+            raise ValueError("Input file must contain a JSON array of events")
+    except BaseException:
+        file.close()
+        raise
+    return _iter_array_items(file, itertools.chain((first,), parser))
 
-def load_events_from_file(path: Path) -> list[dict[str, Any]]:
-    with path.open("r", encoding="utf-8") as file:
-        data = json.load(file)
-    if isinstance(data, list):
-        return data
-    raise ValueError("Input file must contain a JSON array of events")
+
+def _iter_array_items(file: BinaryIO, parser: Iterator[tuple[str, str, Any]]) -> Iterator[dict[str, Any]]:
+    with file:
+        yield from ijson.items(parser, "item")
+
+
+def _iter_batches(events: Iterator[dict[str, Any]], size: int) -> Iterator[list[dict[str, Any]]]:
+    while batch := list(itertools.islice(events, size)):
+        yield batch
 
 
 async def run_file_ingest(path: Path) -> None:
-    events = load_events_from_file(path)
     repository = get_anomaly_repository()
     dispatcher = AlertDispatcher([])
     processor = PipelineProcessor(
@@ -34,10 +65,32 @@ async def run_file_ingest(path: Path) -> None:
         enricher=NoOpEnricher(),
     )
 
-    for event in events:
-        await processor.process_raw_event(event, collector="cli")
-
-    print(f"Processed {len(events)} events. Stored anomalies: {len(repository.list_recent_models())}")
+    # Batches are independent, so overlap their I/O while capping in-flight work.
+    # The semaphore is taken before parsing further, keeping memory bounded as well.
+    semaphore = asyncio.Semaphore(INGEST_CONCURRENCY)
+
+    async def process(batch: list[dict[str, Any]]) -> None:
+        try:
+            await processor.process_raw_batch(batch, collector="cli")
+        finally:
+            semaphore.release()
+
+    events = iter_events_from_file(path)
+    processed = 0
+    try:
+        async with asyncio.TaskGroup() as group:
+            for batch in _iter_batches(events, INGEST_BATCH_SIZE):
+                await semaphore.acquire()
+                group.create_task(process(batch))
+                processed += len(batch)
+    except ExceptionGroup as errors:
+        # Surface the first failure itself (e.g. NormalizationError), not the TaskGroup wrapper.
+        raise errors.exceptions[0] from None
+    finally:
+        # Channels keep SMTP sessions and HTTP clients open between alerts.
+        await dispatcher.aclose()
+
+    print(f"Processed {processed} events. Stored anomalies: {len(repository.list_recent())}")
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -57,8 +110,8 @@ async def main_async(args: argparse.Namespace) -> None:
         await run_file_ingest(args.path)
     elif args.command == "stats":
         repository = get_anomaly_repository()
-        anomalies = repository.list_recent_models()
-        print(json.dumps([record.dict() for record in anomalies], default=str, indent=2))
+        anomalies = repository.list_recent()
+        print(json.dumps([record.to_dict() for record in anomalies], default=str, indent=2))
 
 
 def main() -> None:
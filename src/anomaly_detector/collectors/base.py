@@ -4,22 +4,27 @@ from __future__ import annotations
 
 import abc
 import asyncio
-from dataclasses import dataclass
-from typing import Any, AsyncIterator, Optional
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Mapping, Optional
 
 from anomaly_detector.pipeline.models import Event
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class CollectorContext:
     """Context data shared with collectors at runtime."""
 
     name: str
     source: str
-    extra: dict[str, Any]
+    extra: Mapping[str, Any] = field(default_factory=dict, hash=False)
 
+    def __post_init__(self) -> None:
+        # Freeze the mapping too; it is left out of the hash because proxies are unhashable.
+        object.__setattr__(self, "extra", MappingProxyType(dict(self.extra)))
 
-@dataclass(slots=True)
+
+@dataclass(slots=True, frozen=True)
 class CollectorConfig:
     """Minimal configuration required by collectors."""
 
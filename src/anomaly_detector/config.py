@@ -1,11 +1,10 @@
 """Application configuration and settings management."""
 
-from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import Annotated, Any, Optional
 
 from pydantic import Field, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
 ROOT_DIR = Path(__file__).resolve().parent.parent
 CONFIG_DIR = ROOT_DIR.parent / "config"
@@ -19,7 +18,8 @@ class Settings(BaseSettings):
     debug: bool = Field(True, env="APP_DEBUG")
     api_host: str = Field("0.0.0.0", env="API_HOST")
     api_port: int = Field(8080, env="API_PORT")
-    cors_origins: str = Field("*", env="CORS_ORIGINS")
+    # NoDecode keeps pydantic-settings from JSON-decoding the comma-separated env value.
+    cors_origins: Annotated[list[str], NoDecode] = Field(["*"], env="CORS_ORIGINS")
 
     db_host: str = Field("localhost", env="DB_HOST")
     db_port: int = Field(5432, env="DB_PORT")
@@ -52,6 +52,13 @@ class Settings(BaseSettings):
     smtp_password: Optional[str] = Field(None, env="SMTP_PASSWORD")
     smtp_from: Optional[str] = Field(None, env="SMTP_FROM")
 
+    @field_validator("cors_origins", mode="before")
+    @classmethod
+    def _split_cors_origins(cls, value: Any) -> Any:
+        if isinstance(value, str):
+            return [origin.strip() for origin in value.split(",") if origin.strip()]
+        return value
+
     @field_validator("smtp_port", mode="before")
     @classmethod
     def _empty_str_to_none(cls, value: Any) -> Any:
@@ -63,11 +70,16 @@ class Settings(BaseSettings):
     jwt_expires_in: int = Field(3600, env="JWT_EXPIRES_IN")
 
 
-@lru_cache()
+_SETTINGS: Optional[Settings] = None
+
+
 def get_settings() -> Settings:
     """Return cached application settings."""
 
-    return Settings()  # type: ignore[call-arg]
+    global _SETTINGS
+    if _SETTINGS is None:
+        _SETTINGS = Settings()  # type: ignore[call-arg]
+    return _SETTINGS
 
 
 def settings_dict() -> dict[str, Any]:
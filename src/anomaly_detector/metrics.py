@@ -2,23 +2,30 @@
 
 from __future__ import annotations
 
-from prometheus_client import Counter, Gauge
+from prometheus_client import CollectorRegistry, Counter, Gauge, ProcessCollector
+
+# Dedicated registry: scrapes skip the default GC/platform collectors and only
+# format the anomaly metrics plus basic process stats.
+REGISTRY = CollectorRegistry()
+ProcessCollector(registry=REGISTRY)
 
 ANOMALY_COUNTER = Counter(
     "anomaly_detector_events_total",
     "Total number of events processed by the anomaly detector",
     labelnames=("type",),
+    registry=REGISTRY,
 )
 
 ANOMALY_SCORE_GAUGE = Gauge(
     "anomaly_detector_last_score",
     "Score of the most recent anomaly detection",
     labelnames=("detector",),
+    registry=REGISTRY,
 )
 
 
-def record_event(event_type: str) -> None:
-    ANOMALY_COUNTER.labels(type=event_type).inc()
+def record_event(event_type: str, count: int = 1) -> None:
+    ANOMALY_COUNTER.labels(type=event_type).inc(count)
 
 
 def record_score(detector: str, score: float) -> None:
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import abc
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Iterable, Sequence
 
 import numpy as np
@@ -36,6 +37,11 @@ class Detector(abc.ABC):
     def evaluate(self, event: Event) -> DetectionResult:
         """Score a single event and return a detection result."""
 
+    def evaluate_many(self, events: Sequence[Event]) -> list[DetectionResult]:
+        """Score a batch of events; detectors with a vectorized path override this."""
+
+        return [self.evaluate(event) for event in events]
+
 
 class CompositeDetector(Detector):
     """Aggregate multiple detectors and choose the highest score."""
@@ -51,19 +57,32 @@ class CompositeDetector(Detector):
             return DetectionResult(event=event, score=0.0, description="no detectors", detector="none")
         return best
 
+    def evaluate_many(self, events: Sequence[Event]) -> list[DetectionResult]:
+        if not self._detectors:
+            return [
+                DetectionResult(event=event, score=0.0, description="no detectors", detector="none")
+                for event in events
+            ]
+        batches = [detector.evaluate_many(events) for detector in self._detectors]
+        return [max(results, key=lambda result: result.score) for results in zip(*batches)]
+
+
+_SCANNED_PROTOCOLS = frozenset(("tcp", "udp", "ssh"))
+_DEFAULT_SENSITIVE_PORTS = frozenset((22, 23, 3389, 5900))
+
 
 class PortScanHeuristicDetector(Detector):
     """Simple heuristic that flags repeated port access patterns."""
 
     def __init__(self, *, sensitive_ports: Iterable[int] | None = None) -> None:
         super().__init__(name="port-scan-heuristic")
-        self._sensitive_ports = set(sensitive_ports or {22, 23, 3389, 5900})
+        self._sensitive_ports = frozenset(sensitive_ports or _DEFAULT_SENSITIVE_PORTS)
 
     def evaluate(self, event: Event) -> DetectionResult:
         score = 0.0
         description = "benign"
 
-        if event.destination_port in self._sensitive_ports and event.protocol in {"tcp", "udp", "ssh"}:
+        if event.destination_port in self._sensitive_ports and event.protocol in _SCANNED_PROTOCOLS:
             score += 0.6
             description = "Sensitive service targeted"
 
@@ -71,7 +90,8 @@ class PortScanHeuristicDetector(Detector):
             score += 0.2
             description = "Loopback access to sensitive port"
 
-        if "failed" in (event.payload.get("message", "").lower() if event.payload else ""):
+        message = event.payload.get("message") if event.payload else None
+        if isinstance(message, str) and "failed" in message.casefold():
             score += 0.2
             description = "Repeated failure on sensitive port"
 
@@ -79,16 +99,33 @@ class PortScanHeuristicDetector(Detector):
         return DetectionResult(event=event, score=score, description=description, detector=self.name)
 
 
+_PROTO_MAP: dict[str, int] = {"tcp": 1, "udp": 2, "icmp": 3, "http": 4, "https": 5, "ssh": 6}
+
+FeatureKey = tuple[int, int, int, int, int]
+
+
+def _event_features(event: Event) -> FeatureKey:
+    return (
+        event.source_port or 0,
+        event.destination_port or 0,
+        _PROTO_MAP.get((event.protocol or "").lower(), 0),
+        len(event.payload or {}),
+        len(event.tags),
+    )
+
+
+@lru_cache(maxsize=4096)
+def _vector_from_features(features: FeatureKey) -> np.ndarray:
+    vector = np.array(features, dtype=float)
+    # Cached vectors are shared between callers, so they must never be mutated.
+    vector.flags.writeable = False
+    return vector
+
+
 def _event_to_vector(event: Event) -> np.ndarray:
-    """Convert an event into a numeric feature vector for ML detectors."""
+    """Convert an event into a read-only numeric feature vector for ML detectors."""
 
-    src_port = event.source_port or 0
-    dst_port = event.destination_port or 0
-    protocol_map = {"tcp": 1, "udp": 2, "icmp": 3, "http": 4, "https": 5, "ssh": 6}
-    protocol_value = protocol_map.get((event.protocol or "").lower(), 0)
-    payload_size = len(event.payload or {})
-    tags_count = len(event.tags)
-    return np.array([src_port, dst_port, protocol_value, payload_size, tags_count], dtype=float)
+    return _vector_from_features(_event_features(event))
 
 
 class IsolationForestDetector(Detector):
@@ -114,17 +151,31 @@ class IsolationForestDetector(Detector):
         self.model.fit(vectors)
         self._fitted = True
 
+    def _normalized_scores(self, vectors: np.ndarray) -> np.ndarray:
+        """Map decision values onto [0, 1], higher meaning more anomalous."""
+
+        scores = -self.model.decision_function(vectors)
+        return np.clip((scores + 1) * 0.5, 0.0, 1.0, out=scores)
+
     def evaluate(self, event: Event) -> DetectionResult:
+        return self.evaluate_many([event])[0]
+
+    def evaluate_many(self, events: Sequence[Event]) -> list[DetectionResult]:
         if not self._fitted:
             raise RuntimeError("IsolationForestDetector must be fitted before evaluation")
-
-        vector = _event_to_vector(event).reshape(1, -1)
-        score = -self.model.decision_function(vector)[0]
-        normalized = float((score + 1) / 2)
-        description = "IsolationForest anomaly" if normalized >= 0.5 else "IsolationForest benign"
-        return DetectionResult(
-            event=event,
-            score=min(max(normalized, 0.0), 1.0),
-            description=description,
-            detector=self.name,
-        )
+        if not events:
+            return []
+
+        vectors = np.stack([_event_to_vector(event) for event in events])
+        scores = self._normalized_scores(vectors)
+        return [
+            DetectionResult(
+                event=event,
+                score=float(score),
+                description=(
+                    "IsolationForest anomaly" if score >= 0.5 else "IsolationForest benign"
+                ),
+                detector=self.name,
+            )
+            for event, score in zip(events, scores)
+        ]
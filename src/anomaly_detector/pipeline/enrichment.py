@@ -3,12 +3,55 @@
 from __future__ import annotations
 
 import abc
+import asyncio
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Any, Mapping, Optional, Sequence
+from typing import Any, Callable, Mapping, Optional, Sequence
 
 from anomaly_detector.pipeline.models import Event
 
+# Per-enricher cache of lookups keyed by IP; scan floods repeat the same addresses heavily.
+LOOKUP_CACHE_SIZE = 50_000
+
+
+class _LookupCache:
+    """Bounded LRU of per-IP lookup results, consulted on the event loop."""
+
+    def __init__(
+        self, lookup: Callable[[str], dict[str, Any]], maxsize: int = LOOKUP_CACHE_SIZE
+    ) -> None:
+        self._lookup = lookup
+        self._maxsize = maxsize
+        self._entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        # Lookups in flight per IP, so a burst of misses for one address shares one thread hop.
+        self._pending: dict[str, asyncio.Future[dict[str, Any]]] = {}
+
+    async def get(self, ip: str) -> dict[str, Any]:
+        metadata = self._entries.get(ip)
+        if metadata is not None:
+            self._entries.move_to_end(ip)
+        else:
+            pending = self._pending.get(ip)
+            if pending is None:
+                # MaxMind readers are synchronous; only cache misses leave the event loop.
+                pending = asyncio.ensure_future(asyncio.to_thread(self._lookup, ip))
+                self._pending[ip] = pending
+                pending.add_done_callback(partial(self._store, ip))
+            # Shielded so one cancelled caller does not cancel the lookup others await.
+            metadata = await asyncio.shield(pending)
+        # Hand out a copy: the processor stores it on the event payload, which callers may mutate.
+        return dict(metadata)
+
+    def _store(self, ip: str, future: asyncio.Future[dict[str, Any]]) -> None:
+        del self._pending[ip]
+        if future.cancelled() or future.exception() is not None:
+            return
+        self._entries[ip] = future.result()
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
 
 @dataclass(slots=True)
 class EnrichmentResult:
@@ -30,17 +73,17 @@ class Enricher(abc.ABC):
 
 
 class CompositeEnricher(Enricher):
-    """Chain multiple enrichers sequentially."""
+    """Run multiple independent enrichers concurrently and merge their metadata."""
 
     def __init__(self, enrichers: Sequence[Enricher]) -> None:
         super().__init__(name="composite")
         self._enrichers = list(enrichers)
 
     async def enrich(self, event: Event) -> EnrichmentResult:
-        metadata: dict[str, Any] = {}
-        for enricher in self._enrichers:
-            result = await enricher.enrich(event)
-            metadata[enricher.name] = result.metadata
+        results = await asyncio.gather(*(enricher.enrich(event) for enricher in self._enrichers))
+        metadata: dict[str, Any] = {
+            enricher.name: result.metadata for enricher, result in zip(self._enrichers, results)
+        }
         return EnrichmentResult(event=event, metadata=metadata)
 
 
@@ -65,6 +108,7 @@ class GeoIPEnricher(Enricher):
     ) -> None:
         super().__init__(name="geoip")
         self._reader = reader or self._load_reader(database_path)
+        self._cache = _LookupCache(self._lookup_sync)
 
     def _load_reader(self, database_path: str | Path | None) -> Any | None:
         if database_path is None:
@@ -78,14 +122,20 @@ class GeoIPEnricher(Enricher):
         return Reader(str(database_path))
 
     async def enrich(self, event: Event) -> EnrichmentResult:
-        metadata: dict[str, Any] = {}
-        reader = self._reader
         ip = event.source_ip or event.destination_ip
-        if reader is None or ip is None:
-            return EnrichmentResult(event=event, metadata=metadata)
+        if self._reader is None or ip is None:
+            return EnrichmentResult(event=event, metadata={})
 
+        metadata = await self._cache.get(str(ip))
+        return EnrichmentResult(event=event, metadata=metadata)
+
+    def _lookup_sync(self, ip: str) -> dict[str, Any]:
+        reader = self._reader
+        if reader is None:
+            return {}
+        metadata: dict[str, Any]
         try:
-            record = reader.city(str(ip))
+            record = reader.city(ip)
             metadata = {
                 "country": getattr(record.country, "iso_code", None),
                 "country_name": getattr(record.country, "name", None),
@@ -95,7 +145,7 @@ class GeoIPEnricher(Enricher):
             }
         except Exception:  # pragma: no cover - depends on external db
             metadata = {}
-        return EnrichmentResult(event=event, metadata={k: v for k, v in metadata.items() if v})
+        return {k: v for k, v in metadata.items() if v}
 
 
 class ASNEnricher(Enricher):
@@ -109,6 +159,7 @@ class ASNEnricher(Enricher):
     ) -> None:
         super().__init__(name="asn")
         self._reader = reader or self._load_reader(database_path)
+        self._cache = _LookupCache(self._lookup_sync)
 
     def _load_reader(self, database_path: str | Path | None) -> Any | None:
         if database_path is None:
@@ -122,19 +173,24 @@ class ASNEnricher(Enricher):
         return Reader(str(database_path))
 
     async def enrich(self, event: Event) -> EnrichmentResult:
-        reader = self._reader
         ip = event.source_ip or event.destination_ip
-        metadata: dict[str, Any] = {}
+        if self._reader is None or ip is None:
+            return EnrichmentResult(event=event, metadata={})
 
-        if reader is None or ip is None:
-            return EnrichmentResult(event=event, metadata=metadata)
+        metadata = await self._cache.get(str(ip))
+        return EnrichmentResult(event=event, metadata=metadata)
 
+    def _lookup_sync(self, ip: str) -> dict[str, Any]:
+        reader = self._reader
+        if reader is None:
+            return {}
+        metadata: dict[str, Any]
         try:
-            record = reader.asn(str(ip))
+            record = reader.asn(ip)
             metadata = {
                 "asn": getattr(record, "autonomous_system_number", None),
                 "asn_org": getattr(record, "autonomous_system_organization", None),
             }
         except Exception:  # pragma: no cover - depends on external db
             metadata = {}
-        return EnrichmentResult(event=event, metadata={k: v for k, v in metadata.items() if v})
+        return {k: v for k, v in metadata.items() if v}
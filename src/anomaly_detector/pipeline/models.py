@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime
 from ipaddress import IPv4Address, IPv6Address
-from typing import Any, Mapping
+from typing import Any
 
 
 IPAddress = IPv4Address | IPv6Address
@@ -21,10 +21,46 @@ class Event:
     source_port: int | None
     destination_port: int | None
     protocol: str | None
-    payload: Mapping[str, Any] = field(default_factory=dict)
+    payload: dict[str, Any] = field(default_factory=dict)
     raw: Any | None = None
     tags: set[str] = field(default_factory=set)
     collector: str | None = None
 
     def add_tag(self, tag: str) -> None:
         self.tags.add(tag)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-ready representation of the event."""
+
+        return {
+            "timestamp": self.timestamp.isoformat(),
+            "source_ip": str(self.source_ip) if self.source_ip is not None else None,
+            "destination_ip": str(self.destination_ip) if self.destination_ip is not None else None,
+            "source_port": self.source_port,
+            "destination_port": self.destination_port,
+            "protocol": self.protocol,
+            "payload": self.payload,
+            "raw": self.raw,
+            "tags": sorted(self.tags),
+            "collector": self.collector,
+        }
+
+    def to_queue_dict(self) -> dict[str, Any]:
+        """Return the flat representation published to queue backends."""
+
+        # Explicit ``is None`` tests avoid the truthiness protocol calls of ``x or default``.
+        source_ip = self.source_ip
+        destination_ip = self.destination_ip
+        source_port = self.source_port
+        destination_port = self.destination_port
+        protocol = self.protocol
+        collector = self.collector
+        return {
+            "timestamp": self.timestamp.isoformat(),
+            "source_ip": "" if source_ip is None else str(source_ip),
+            "destination_ip": "" if destination_ip is None else str(destination_ip),
+            "source_port": 0 if source_port is None else source_port,
+            "destination_port": 0 if destination_port is None else destination_port,
+            "protocol": "" if protocol is None else protocol,
+            "collector": "" if collector is None else collector,
+        }
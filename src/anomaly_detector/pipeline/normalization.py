@@ -4,12 +4,20 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from ipaddress import ip_address
-from typing import Any, Mapping, MutableMapping, Optional
+from typing import Any, Mapping, Optional
 
 from anomaly_detector.pipeline.models import Event, IPAddress
 
 
+@lru_cache(maxsize=65536)
+def _cached_ip_address(value: str | int) -> IPAddress:
+    """Parse an IP address, memoized because source/destination IPs repeat heavily."""
+
+    return ip_address(value)
+
+
 class NormalizationError(Exception):
     """Raised when a payload cannot be normalized."""
 
@@ -29,18 +37,35 @@ class EventNormalizer:
     SOURCE_PORT_KEYS = ("src_port", "source_port")
     DEST_PORT_KEYS = ("dst_port", "destination_port")
     PROTOCOL_KEYS = ("protocol", "proto")
+    _ALIAS_KEYS = frozenset(
+        TIMESTAMP_KEYS
+        + SOURCE_IP_KEYS
+        + DEST_IP_KEYS
+        + SOURCE_PORT_KEYS
+        + DEST_PORT_KEYS
+        + PROTOCOL_KEYS
+    )
 
     def __init__(self, *, allow_missing_ip: bool = True) -> None:
         self.allow_missing_ip = allow_missing_ip
 
     def normalize(self, raw: Mapping[str, Any], *, collector: str | None = None) -> NormalizationResult:
-        payload = dict(raw)
-        timestamp = self._extract_timestamp(payload)
-        src_ip = self._extract_ip(payload, self.SOURCE_IP_KEYS)
-        dst_ip = self._extract_ip(payload, self.DEST_IP_KEYS)
-        src_port = self._extract_int(payload, self.SOURCE_PORT_KEYS)
-        dst_port = self._extract_int(payload, self.DEST_PORT_KEYS)
-        protocol = self._extract_str(payload, self.PROTOCOL_KEYS)
+        # Single pass: canonical fields are routed aside, everything else stays in the payload.
+        fields: dict[str, Any] = {}
+        payload: dict[str, Any] = {}
+        alias_keys = self._ALIAS_KEYS
+        for key, value in raw.items():
+            if key in alias_keys:
+                fields[key] = value
+            else:
+                payload[key] = value
+
+        timestamp = self._extract_timestamp(fields)
+        src_ip = self._extract_ip(fields, self.SOURCE_IP_KEYS)
+        dst_ip = self._extract_ip(fields, self.DEST_IP_KEYS)
+        src_port = self._extract_int(fields, self.SOURCE_PORT_KEYS)
+        dst_port = self._extract_int(fields, self.DEST_PORT_KEYS)
+        protocol = self._extract_str(fields, self.PROTOCOL_KEYS)
 
         if not self.allow_missing_ip and (src_ip is None and dst_ip is None):
             raise NormalizationError("Missing both source and destination IP addresses")
@@ -58,9 +83,9 @@ class EventNormalizer:
         )
         return NormalizationResult(event=event, discarded_fields={})
 
-    def _extract_timestamp(self, payload: MutableMapping[str, Any]) -> datetime:
+    def _extract_timestamp(self, fields: Mapping[str, Any]) -> datetime:
         for key in self.TIMESTAMP_KEYS:
-            value = payload.pop(key, None)
+            value = fields.get(key)
             if value:
                 if isinstance(value, datetime):
                     return value
@@ -70,19 +95,21 @@ class EventNormalizer:
                     return datetime.fromisoformat(value.replace("Z", "+00:00"))
         raise NormalizationError("Timestamp field not found")
 
-    def _extract_ip(self, payload: MutableMapping[str, Any], keys: tuple[str, ...]) -> Optional[IPAddress]:
+    def _extract_ip(self, fields: Mapping[str, Any], keys: tuple[str, ...]) -> Optional[IPAddress]:
         for key in keys:
-            value = payload.pop(key, None)
+            value = fields.get(key)
             if value:
                 try:
+                    if isinstance(value, (str, int)):
+                        return _cached_ip_address(value)
                     return ip_address(value)
                 except ValueError as exc:
                     raise NormalizationError(f"Invalid IP address: {value}") from exc
         return None
 
-    def _extract_int(self, payload: MutableMapping[str, Any], keys: tuple[str, ...]) -> Optional[int]:
+    def _extract_int(self, fields: Mapping[str, Any], keys: tuple[str, ...]) -> Optional[int]:
         for key in keys:
-            value = payload.pop(key, None)
+            value = fields.get(key)
             if value is None:
                 continue
             try:
@@ -92,9 +119,9 @@ class EventNormalizer:
             return number
         return None
 
-    def _extract_str(self, payload: MutableMapping[str, Any], keys: tuple[str, ...]) -> Optional[str]:
+    def _extract_str(self, fields: Mapping[str, Any], keys: tuple[str, ...]) -> Optional[str]:
         for key in keys:
-            value = payload.pop(key, None)
+            value = fields.get(key)
             if isinstance(value, str):
                 return value.lower()
             if value is not None:
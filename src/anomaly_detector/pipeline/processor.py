@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Any, Mapping, Optional
+import asyncio
+from datetime import datetime
+from typing import Any, Mapping, Optional, Sequence
 
 from anomaly_detector.alerts.base import Alert, AlertDispatcher
 from anomaly_detector.pipeline.detection import Detector, DetectionResult
@@ -51,6 +53,9 @@ class PipelineProcessor:
                     self.enricher = CompositeEnricher(enricher_chain)
             else:
                 self.enricher = NoOpEnricher()
+        # Skip the per-event await entirely when enrichment cannot add anything. Exact type
+        # check: subclasses of NoOpEnricher may override enrich() and must still run.
+        self._enrich_enabled = type(self.enricher) is not NoOpEnricher
         self.repository = repository or InMemoryAnomalyRepository()
         self.dispatcher = dispatcher
         self.anomaly_threshold = anomaly_threshold
@@ -60,40 +65,59 @@ class PipelineProcessor:
     ) -> DetectionResult:
         """Normalize, enrich, detect and optionally alert on a raw event."""
 
-        normalization = self.normalizer.normalize(raw_event, collector=collector)
-        event = normalization.event
-        record_event("processed")
+        (detection,) = await self.process_raw_batch([raw_event], collector=collector)
+        return detection
+
+    async def process_raw_batch(
+        self, raw_events: Sequence[Mapping[str, Any]], *, collector: str | None = None
+    ) -> list[DetectionResult]:
+        """Process a batch of raw events, scoring them with a single detector call."""
+
+        events = [self.normalizer.normalize(raw, collector=collector).event for raw in raw_events]
+        record_event("processed", len(events))
 
-        enrichment = await self.enricher.enrich(event)
-        if enrichment.metadata:
-            enriched_payload = dict(event.payload)
-            enriched_payload["enrichment"] = enrichment.metadata
-            event.payload = enriched_payload
+        if self._enrich_enabled:
+            # Enrichment lookups run off the event loop, so overlap them across the batch.
+            enrichments = await asyncio.gather(*(self.enricher.enrich(event) for event in events))
+            for event, enrichment in zip(events, enrichments):
+                if enrichment.metadata:
+                    # The normalizer builds a fresh payload per event, so it is safe to update in place.
+                    event.payload["enrichment"] = enrichment.metadata
 
         if self.detector is None:
-            detection = DetectionResult(
-                event=event,
-                score=0.0,
-                detector="none",
-            )
+            detections = [
+                DetectionResult(event=event, score=0.0, description="no detector", detector="none")
+                for event in events
+            ]
         else:
-            detection = self.detector.evaluate(event)
+            detections = self.detector.evaluate_many(events)
 
-        record_score(detection.detector, detection.score)
+        # Bind hot attributes locally; most events are benign and leave the loop right after scoring.
+        threshold = self.anomaly_threshold
+        repository_add = self.repository.add
+        dispatcher = self.dispatcher
+        detected_at: datetime | None = None
+        for detection in detections:
+            score = detection.score
+            record_score(detection.detector, score)
+            if score < threshold:
+                continue
 
-        if detection.score >= self.anomaly_threshold:
+            if detected_at is None:
+                detected_at = datetime.utcnow()
+            event = detection.event
             event.add_tag("anomaly")
             record_event("anomaly")
-            record = self.repository.add(
-                score=detection.score,
+            record = repository_add(
+                score=score,
                 description=detection.description,
                 event=event,
+                detected_at=detected_at,
             )
-            if self.dispatcher is not None:
-                alert = self._build_alert(record.event, detection)
-                await self.dispatcher.dispatch(alert)
+            if dispatcher is not None:
+                await dispatcher.dispatch(self._build_alert(record.event, detection))
 
-        return detection
+        return detections
 
     def _build_alert(self, event: Event, detection: DetectionResult) -> Alert:
         severity = self._severity_from_score(detection.score)
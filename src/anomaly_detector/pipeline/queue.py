@@ -6,6 +6,8 @@ import asyncio
 from dataclasses import dataclass
 from typing import Iterable, Protocol
 
+import orjson
+
 from anomaly_detector.config import get_settings
 
 from anomaly_detector.pipeline.models import Event
@@ -33,18 +35,17 @@ class InMemoryQueueProducer:
     """Simple in-memory queue producer for testing and local development."""
 
     def __init__(self) -> None:
-        self._lock = asyncio.Lock()
         self.events: list[Event] = []
 
     async def send_batch(self, events: list[Event]) -> None:
-        async with self._lock:
-            self.events.extend(events)
+        # No lock needed: there is no await between reading and extending the list, and
+        # list.extend is atomic under the CPython GIL, so concurrent batches cannot interleave.
+        self.events.extend(events)
 
     def drain(self) -> Iterable[Event]:
         """Return and clear collected events."""
 
-        events = list(self.events)
-        self.events.clear()
+        events, self.events = self.events, []
         return events
 
 
@@ -68,25 +69,15 @@ class RedisQueueProducer:
         if not events:
             return
 
-        payloads = []
-        for event in events:
-            payloads.append(
-                {
-                    "timestamp": event.timestamp.isoformat(),
-                    "source_ip": str(event.source_ip) if event.source_ip else "",
-                    "destination_ip": str(event.destination_ip) if event.destination_ip else "",
-                    "source_port": event.source_port or 0,
-                    "destination_port": event.destination_port or 0,
-                    "protocol": event.protocol or "",
-                    "collector": event.collector or "",
-                }
-            )
+        payloads = [event.to_queue_dict() for event in events]
 
         for attempt in range(1, self._max_retries + 1):
             try:
-                await asyncio.gather(
-                    *(self._redis.xadd(self._stream, data) for data in payloads)
-                )
+                # Queue every XADD and flush them in a single round-trip.
+                pipe = self._redis.pipeline(transaction=False)
+                for data in payloads:
+                    pipe.xadd(self._stream, data)
+                await pipe.execute()
                 return
             except Exception as exc:  # pragma: no cover - networking issues
                 if attempt >= self._max_retries:
@@ -103,14 +94,22 @@ class KafkaQueueProducer:
         settings = get_settings()
         self._topic = topic
         self._max_retries = max_retries
-        self._producer = AIOKafkaProducer(bootstrap_servers=settings.kafka_bootstrap)
+        self._producer = AIOKafkaProducer(
+            bootstrap_servers=settings.kafka_bootstrap,
+            linger_ms=5,
+            compression_type="lz4",
+        )
         self._startup_lock = asyncio.Lock()
+        self._started = False
 
     async def _ensure_started(self) -> None:
-        if self._producer._closed:  # type: ignore[attr-defined]
-            async with self._startup_lock:
-                if self._producer._closed:  # type: ignore[attr-defined]
-                    await self._producer.start()
+        if self._started:
+            return
+        async with self._startup_lock:
+            if self._started:
+                return
+            await self._producer.start()
+            self._started = True
 
     async def send_batch(self, events: list[Event]) -> None:
         if not events:
@@ -118,36 +117,43 @@ class KafkaQueueProducer:
 
         await self._ensure_started()
 
-        payloads = []
-        for event in events:
-            payloads.append(
-                {
-                    "timestamp": event.timestamp.isoformat(),
-                    "source_ip": str(event.source_ip) if event.source_ip else "",
-                    "destination_ip": str(event.destination_ip) if event.destination_ip else "",
-                    "source_port": event.source_port or 0,
-                    "destination_port": event.destination_port or 0,
-                    "protocol": event.protocol or "",
-                    "collector": event.collector or "",
-                }
-            )
-
+        pending = [orjson.dumps(event.to_queue_dict()) for event in events]
         for attempt in range(1, self._max_retries + 1):
+            # Enqueue without waiting for per-record acks and let aiokafka coalesce the
+            # batch into one produce request per partition; only failed records are retried.
+            error: BaseException | None = None
+            futures: list[asyncio.Future[object]] = []
             try:
-                await asyncio.gather(
-                    *(
-                        self._producer.send_and_wait(self._topic, str(data).encode("utf-8"))
-                        for data in payloads
-                    )
-                )
-                return
+                for value in pending:
+                    futures.append(await self._producer.send(self._topic, value))
+            except Exception as exc:
+                # Buffer full or metadata timeout: the records sent so far stay enqueued.
+                error = exc
+            try:
+                await self._producer.flush()
             except Exception as exc:  # pragma: no cover - networking issues
-                if attempt >= self._max_retries:
-                    raise QueueSendError("Failed to send events to Kafka topic") from exc
-                await asyncio.sleep(0.1 * attempt)
+                error = error or exc
+
+            retry: list[bytes] = []
+            for value, future in zip(pending, futures):
+                if not future.done() or future.cancelled():
+                    retry.append(value)
+                elif future.exception() is not None:
+                    retry.append(value)
+                    error = error or future.exception()
+            # Records never handed to the producer because send() raised part-way.
+            retry.extend(pending[len(futures):])
+            if not retry:
+                return
+            pending = retry
+
+            if attempt >= self._max_retries:
+                raise QueueSendError("Failed to send events to Kafka topic") from error
+            await asyncio.sleep(0.1 * attempt)
 
     async def close(self) -> None:
-        if not self._producer._closed:  # type: ignore[attr-defined]
+        if self._started:
+            self._started = False
             await self._producer.stop()
 
 
@@ -169,3 +175,22 @@ def create_queue_producer() -> QueueProducer:
         )
 
     raise ValueError(f"Unsupported queue backend: {backend}")
+
+
+_PRODUCER: QueueProducer | None = None
+
+
+def get_queue_producer() -> QueueProducer:
+    """Return the process-wide producer for the configured backend, creating it once."""
+
+    global _PRODUCER
+    if _PRODUCER is None:
+        _PRODUCER = create_queue_producer()
+    return _PRODUCER
+
+
+def reset_queue_producer() -> None:
+    """Forget the cached producer so the next call re-reads settings (used by tests)."""
+
+    global _PRODUCER
+    _PRODUCER = None
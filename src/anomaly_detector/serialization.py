@@ -0,0 +1,18 @@
+"""Shared orjson helpers for API responses and cached anomaly records."""
+
+from __future__ import annotations
+
+from ipaddress import IPv4Address, IPv6Address
+from typing import Any
+
+
+def orjson_default(value: Any) -> Any:
+    """Serialize types orjson does not handle natively, matching Pydantic's JSON mode."""
+
+    if isinstance(value, (IPv4Address, IPv6Address)):
+        return str(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, (bytes, bytearray)):
+        return bytes(value).decode("utf-8", errors="replace")
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
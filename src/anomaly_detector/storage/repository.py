@@ -2,13 +2,60 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+from collections import deque
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Iterable, List
+from datetime import date, datetime
+from itertools import islice
+from typing import Any, Deque, List, Set
 
-from pydantic import BaseModel
+import orjson
 
 from anomaly_detector.pipeline.models import Event
+from anomaly_detector.serialization import orjson_default
+
+
+def _record_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        # Match orjson's native ISO format when the stdlib fallback encodes the record.
+        return value.isoformat()
+    # Fall back to str so arbitrary collector payload values cannot break ingestion.
+    try:
+        return orjson_default(value)
+    except TypeError:
+        return str(value)
+
+
+def _json_key(key: Any) -> Any:
+    if key is None or isinstance(key, (str, int, float, bool)):
+        return key
+    if isinstance(key, (datetime, date)):
+        return key.isoformat()
+    return str(key)
+
+
+def _stringify_keys(value: Any) -> Any:
+    """Recursively replace dict keys the stdlib encoder rejects (e.g. tuples) with strings."""
+
+    if isinstance(value, dict):
+        return {_json_key(key): _stringify_keys(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_stringify_keys(item) for item in value]
+    return value
+
+
+def _encode_record(data: dict[str, Any]) -> bytes:
+    """Serialize a record dict, falling back to the stdlib encoder for values orjson rejects."""
+
+    try:
+        return orjson.dumps(data, default=_record_default, option=orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError:
+        # orjson refuses integers wider than 64 bits and keys such as tuples; the rare
+        # fallback pays for one pass that normalizes keys before the stdlib encoder runs.
+        return json.dumps(
+            _stringify_keys(data), default=_record_default, separators=(",", ":")
+        ).encode()
 
 
 @dataclass(slots=True)
@@ -19,43 +66,95 @@ class AnomalyRecord:
     description: str
     event: Event
 
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-ready representation of the record."""
+
+        return {
+            "id": self.id,
+            "detected_at": self.detected_at.isoformat(),
+            "score": self.score,
+            "description": self.description,
+            "event": self.event.to_dict(),
+        }
+
 
 class InMemoryAnomalyRepository:
     """Simple repository storing anomalies in memory for prototyping."""
 
-    def __init__(self) -> None:
-        self._items: List[AnomalyRecord] = []
+    def __init__(self, *, max_items: int = 10_000, recent_json_size: int = 1024) -> None:
+        # Bounded so long-running processes do not grow without limit; oldest records drop off.
+        self._items: Deque[AnomalyRecord] = deque(maxlen=max_items)
+        # Ring buffer of records serialized once at insertion, newest last.
+        self._recent_json: Deque[bytes] = deque(maxlen=recent_json_size)
         self._counter: int = 0
+        self._version: int = 0
+        self._waiters: Set[asyncio.Future[None]] = set()
+
+    @property
+    def version(self) -> int:
+        """Monotonic counter bumped whenever the stored anomalies change."""
+
+        return self._version
+
+    async def wait_for_change(self, version: int) -> int:
+        """Wait until the repository moves past ``version`` and return the new version."""
+
+        while self._version == version:
+            waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            self._waiters.add(waiter)
+            try:
+                await waiter
+            finally:
+                self._waiters.discard(waiter)
+        return self._version
+
+    def _notify_changed(self) -> None:
+        self._version += 1
+        for waiter in self._waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+        self._waiters.clear()
+
+    def add(
+        self,
+        *,
+        score: float,
+        description: str,
+        event: Event,
+        detected_at: datetime | None = None,
+    ) -> AnomalyRecord:
+        """Store an anomaly; batch callers pass one shared ``detected_at`` for all records."""
 
-    def add(self, *, score: float, description: str, event: Event) -> AnomalyRecord:
-        self._counter += 1
         record = AnomalyRecord(
-            id=self._counter,
-            detected_at=datetime.utcnow(),
+            id=self._counter + 1,
+            detected_at=detected_at if detected_at is not None else datetime.utcnow(),
             score=score,
             description=description,
             event=event,
         )
+        # Encode before touching any state so a failure cannot leave a half-stored record.
+        encoded = _encode_record(record.to_dict())
+        self._counter = record.id
         self._items.append(record)
+        self._recent_json.append(encoded)
+        self._notify_changed()
         return record
 
-    def list_recent(self, limit: int = 50) -> Iterable[AnomalyRecord]:
-        return list(reversed(self._items))[:limit]
+    def list_recent(self, limit: int = 50) -> List[AnomalyRecord]:
+        return list(islice(reversed(self._items), limit))
 
     def clear(self) -> None:
         self._items.clear()
+        self._recent_json.clear()
         self._counter = 0
+        self._notify_changed()
 
-    def list_recent_models(self, limit: int = 50) -> list[AnomalyRecordModel]:
-        return [AnomalyRecordModel(**record.__dict__) for record in self.list_recent(limit)]
+    def list_recent_bytes(self, limit: int = 50) -> list[bytes]:
+        """Return the cached JSON encodings of the most recent anomalies, newest first."""
 
+        return list(islice(reversed(self._recent_json), limit))
 
-class AnomalyRecordModel(BaseModel):
-    id: int
-    detected_at: datetime
-    score: float
-    description: str
-    event: Event
+    def list_recent_json(self, limit: int = 50) -> bytes:
+        """Return recent anomalies as a JSON array assembled from cached record bytes."""
 
-    class Config:
-        arbitrary_types_allowed = True
+        return b"[" + b",".join(self.list_recent_bytes(limit)) + b"]"
@@ -0,0 +1,80 @@
+import json
+from pathlib import Path
+
+import ijson
+import pytest
+
+from anomaly_detector import cli
+from anomaly_detector.cli import iter_events_from_file, run_file_ingest
+from anomaly_detector.pipeline.normalization import NormalizationError
+from anomaly_detector.pipeline.processor import PipelineProcessor
+
+
+def write(tmp_path: Path, content: str) -> Path:
+    path = tmp_path / "events.json"
+    path.write_text(content)
+    return path
+
+
+def test_iter_events_from_file_streams_array_items(tmp_path: Path) -> None:
+    events = [{"src_ip": "10.0.0.1", "dst_port": 22}, {"src_ip": "10.0.0.2", "score": 0.5}]
+    path = write(tmp_path, json.dumps(events))
+
+    assert list(iter_events_from_file(path)) == events
+
+
+def test_iter_events_from_file_rejects_non_array(tmp_path: Path) -> None:
+    path = write(tmp_path, json.dumps({"src_ip": "10.0.0.1"}))
+
+    with pytest.raises(ValueError, match="JSON array"):
+        iter_events_from_file(path)
+
+
+@pytest.mark.parametrize("content", ["", "not json", "1e99999"])
+def test_iter_events_from_file_rejects_unparseable_input(tmp_path: Path, content: str) -> None:
+    path = write(tmp_path, content)
+
+    with pytest.raises(ValueError, match="JSON array"):
+        iter_events_from_file(path)
+
+
+def test_iter_events_from_file_raises_on_truncated_input(tmp_path: Path) -> None:
+    path = write(tmp_path, '[{"src_ip": "10.0.0.1"}, {"src_ip": "10.0')
+
+    events = iter_events_from_file(path)
+    assert next(events) == {"src_ip": "10.0.0.1"}
+    with pytest.raises(ijson.JSONError):
+        next(events)
+
+
+@pytest.mark.asyncio
+async def test_run_file_ingest_raises_original_error(tmp_path: Path) -> None:
+    events = [
+        {"timestamp": "2024-01-01T00:00:00Z", "src_ip": "10.0.0.1", "dst_ip": "not-an-ip"},
+    ]
+    path = write(tmp_path, json.dumps(events))
+
+    with pytest.raises(NormalizationError, match="Invalid IP address"):
+        await run_file_ingest(path)
+
+
+@pytest.mark.asyncio
+async def test_run_file_ingest_scores_events_in_batches(tmp_path: Path, monkeypatch) -> None:
+    events = [
+        {"timestamp": "2024-01-01T00:00:00Z", "dst_ip": "10.0.0.1", "dst_port": port}
+        for port in range(5)
+    ]
+    path = write(tmp_path, json.dumps(events))
+    batch_sizes: list[int] = []
+    original = PipelineProcessor.process_raw_batch
+
+    async def spy(self, raw_events, *, collector=None):
+        batch_sizes.append(len(raw_events))
+        return await original(self, raw_events, collector=collector)
+
+    monkeypatch.setattr(cli, "INGEST_BATCH_SIZE", 2)
+    monkeypatch.setattr(PipelineProcessor, "process_raw_batch", spy)
+
+    await run_file_ingest(path)
+
+    assert sorted(batch_sizes) == [1, 2, 2]
@@ -0,0 +1,13 @@
+from anomaly_detector.config import Settings, get_settings
+
+
+def test_get_settings_is_memoized() -> None:
+    assert get_settings() is get_settings()
+
+
+def test_cors_origins_split_once_at_load(monkeypatch) -> None:
+    monkeypatch.setenv("CORS_ORIGINS", "http://localhost:5173, http://dashboard.local ,")
+
+    settings = Settings()  # type: ignore[call-arg]
+
+    assert settings.cors_origins == ["http://localhost:5173", "http://dashboard.local"]
@@ -79,3 +79,17 @@ def test_isolation_forest_detects_outlier():
     assert isinstance(result, DetectionResult)
     assert result.score >= 0.5
     assert result.is_anomaly
+
+
+def test_isolation_forest_evaluate_many_matches_evaluate():
+    detector = IsolationForestDetector(contamination=0.2, random_state=1)
+    detector.fit(generate_training_events())
+
+    events = generate_training_events(3) + [
+        make_event(source_port=55555, destination_port=23, protocol="tcp", payload={"size": 20}),
+    ]
+
+    batch = detector.evaluate_many(events)
+    single = [detector.evaluate(event) for event in events]
+    assert [result.score for result in batch] == pytest.approx([result.score for result in single])
+    assert [result.description for result in batch] == [result.description for result in single]
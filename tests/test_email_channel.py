@@ -0,0 +1,114 @@
+from datetime import datetime
+
+import aiosmtplib
+import pytest
+
+from anomaly_detector.alerts import email as email_module
+from anomaly_detector.alerts.base import Alert
+from anomaly_detector.alerts.email import SMTPEmailChannel
+from anomaly_detector.pipeline.models import Event
+
+
+class FakeSMTP:
+    """Stand-in for aiosmtplib.SMTP recording sessions and scripted failures."""
+
+    instances: list["FakeSMTP"] = []
+    send_errors: list[Exception] = []
+    login_error: Exception | None = None
+
+    def __init__(self, **_: object) -> None:
+        self.is_connected = False
+        self.closed = False
+        self.sent: list[object] = []
+        FakeSMTP.instances.append(self)
+
+    async def connect(self) -> None:
+        self.is_connected = True
+
+    async def starttls(self) -> None:
+        pass
+
+    async def login(self, username: str, password: str) -> None:
+        if FakeSMTP.login_error is not None:
+            raise FakeSMTP.login_error
+
+    async def noop(self) -> None:
+        pass
+
+    async def send_message(self, message: object) -> None:
+        if FakeSMTP.send_errors:
+            self.is_connected = False
+            raise FakeSMTP.send_errors.pop(0)
+        self.sent.append(message)
+
+    def close(self) -> None:
+        self.closed = True
+        self.is_connected = False
+
+
+@pytest.fixture
+def channel(monkeypatch) -> SMTPEmailChannel:
+    FakeSMTP.instances = []
+    FakeSMTP.send_errors = []
+    FakeSMTP.login_error = None
+    monkeypatch.setattr(email_module.aiosmtplib, "SMTP", FakeSMTP)
+    channel = SMTPEmailChannel(smtp_host="mail.local", smtp_port=25)
+    channel._sender = "alerts@example.com"
+    channel._username = None
+    channel._password = None
+    return channel
+
+
+def make_alert() -> Alert:
+    event = Event(
+        timestamp=datetime.utcnow(),
+        source_ip=None,
+        destination_ip=None,
+        source_port=None,
+        destination_port=22,
+        protocol="tcp",
+    )
+    return Alert(title="Port scan", severity="high", event=event, metadata={})
+
+
+@pytest.mark.asyncio
+async def test_reconnects_once_after_disconnect(channel: SMTPEmailChannel) -> None:
+    FakeSMTP.send_errors = [aiosmtplib.SMTPServerDisconnected("gone")]
+
+    await channel.send(make_alert())
+
+    first, second = FakeSMTP.instances
+    assert first.closed and not first.sent
+    assert len(second.sent) == 1
+
+
+@pytest.mark.asyncio
+async def test_reuses_session_between_alerts(channel: SMTPEmailChannel) -> None:
+    await channel.send(make_alert())
+    await channel.send(make_alert())
+
+    (client,) = FakeSMTP.instances
+    assert len(client.sent) == 2
+
+
+@pytest.mark.asyncio
+async def test_permanent_refusal_is_not_retried(channel: SMTPEmailChannel) -> None:
+    FakeSMTP.send_errors = [aiosmtplib.SMTPRecipientsRefused([])]
+
+    with pytest.raises(aiosmtplib.SMTPRecipientsRefused):
+        await channel.send(make_alert())
+
+    assert len(FakeSMTP.instances) == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_login_closes_connection(channel: SMTPEmailChannel) -> None:
+    channel._username = "user"
+    channel._password = "secret"
+    FakeSMTP.login_error = aiosmtplib.SMTPAuthenticationError(535, "bad credentials")
+
+    with pytest.raises(aiosmtplib.SMTPAuthenticationError):
+        await channel.send(make_alert())
+
+    (client,) = FakeSMTP.instances
+    assert client.closed
@@ -1,3 +1,4 @@
+import asyncio
 import types
 
 import pytest
@@ -81,3 +82,73 @@ async def test_composite_enricher_chains_results():
 
     result = await composite.enrich(event)
     assert set(result.metadata.keys()) == {"one", "two"}
+
+
+@pytest.mark.asyncio
+async def test_asn_enricher_caches_lookups_per_ip():
+    class CountingASNReader:
+        calls = 0
+
+        def asn(self, ip):
+            self.calls += 1
+            return types.SimpleNamespace(
+                autonomous_system_number=13335,
+                autonomous_system_organization="Cloudflare",
+            )
+
+    reader = CountingASNReader()
+    enricher = ASNEnricher(reader=reader)
+    event = make_event()
+    event.source_ip = type("IP", (), {"__str__": lambda self: "1.1.1.1"})()
+
+    first = await enricher.enrich(event)
+    second = await enricher.enrich(event)
+
+    assert first.metadata == second.metadata == {"asn": 13335, "asn_org": "Cloudflare"}
+    assert reader.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_lookup_is_not_shared_between_events():
+    class StaticASNReader:
+        def asn(self, ip):
+            return types.SimpleNamespace(
+                autonomous_system_number=13335,
+                autonomous_system_organization="Cloudflare",
+            )
+
+    enricher = ASNEnricher(reader=StaticASNReader())
+    event = make_event()
+    event.source_ip = type("IP", (), {"__str__": lambda self: "1.1.1.1"})()
+
+    first = await enricher.enrich(event)
+    first.metadata["asn"] = 0  # type: ignore[index]
+    second = await enricher.enrich(event)
+
+    assert second.metadata["asn"] == 13335
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_lookup():
+    class CountingASNReader:
+        calls = 0
+
+        def asn(self, ip):
+            self.calls += 1
+            return types.SimpleNamespace(
+                autonomous_system_number=13335,
+                autonomous_system_organization="Cloudflare",
+            )
+
+    reader = CountingASNReader()
+    enricher = ASNEnricher(reader=reader)
+    events = []
+    for _ in range(50):
+        event = make_event()
+        event.source_ip = type("IP", (), {"__str__": lambda self: "1.1.1.1"})()
+        events.append(event)
+
+    results = await asyncio.gather(*(enricher.enrich(event) for event in events))
+
+    assert reader.calls == 1
+    assert all(result.metadata["asn"] == 13335 for result in results)
@@ -42,3 +42,21 @@ def test_normalizer_invalid_ip() -> None:
 
     with pytest.raises(NormalizationError):
         normalizer.normalize(raw)
+
+
+def test_normalizer_routes_aliases_out_of_payload() -> None:
+    normalizer = EventNormalizer()
+    raw = {
+        "@timestamp": datetime.utcnow().isoformat(),
+        "client_ip": "10.0.0.1",
+        "server_ip": "10.0.0.2",
+        "proto": "UDP",
+        "message": "dns query",
+    }
+
+    result = normalizer.normalize(raw)
+
+    assert str(result.event.source_ip) == "10.0.0.1"
+    assert str(result.event.destination_ip) == "10.0.0.2"
+    assert result.event.protocol == "udp"
+    assert result.event.payload == {"message": "dns query"}
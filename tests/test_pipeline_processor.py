@@ -5,6 +5,7 @@ import pytest
 
 from anomaly_detector.alerts.base import Alert, AlertChannel
 from anomaly_detector.pipeline.detection import PortScanHeuristicDetector
+from anomaly_detector.pipeline.enrichment import EnrichmentResult, NoOpEnricher
 from anomaly_detector.pipeline.processor import PipelineProcessor
 from anomaly_detector.pipeline.models import Event
 
@@ -39,5 +40,64 @@ async def test_pipeline_processor_detects_and_alerts():
     assert result.is_anomaly
     assert len(channel.alerts) == 1
     assert channel.alerts[0].metadata["description"] == "Sensitive service targeted"
-    repo_events = processor.repository.list_recent_models()
+    repo_events = processor.repository.list_recent()
     assert len(repo_events) == 1
+
+
+@pytest.mark.asyncio
+async def test_pipeline_processor_skips_alert_building_without_dispatcher(monkeypatch):
+    processor = PipelineProcessor(detector=PortScanHeuristicDetector())
+
+    def fail_build_alert(*args, **kwargs):
+        raise AssertionError("alert built without a dispatcher")
+
+    monkeypatch.setattr(processor, "_build_alert", fail_build_alert)
+
+    raw_event = {
+        "timestamp": datetime.utcnow().isoformat(),
+        "dst_ip": "10.0.0.1",
+        "dst_port": 22,
+        "protocol": "tcp",
+    }
+
+    result = await processor.process_raw_event(raw_event, collector="syslog")
+
+    assert result.is_anomaly
+    assert len(processor.repository.list_recent()) == 1
+
+
+@pytest.mark.asyncio
+async def test_pipeline_processor_processes_batches():
+    processor = PipelineProcessor(detector=PortScanHeuristicDetector())
+    now = datetime.utcnow().isoformat()
+    raw_events = [
+        {"timestamp": now, "dst_ip": "10.0.0.1", "dst_port": 22, "protocol": "tcp"},
+        {"timestamp": now, "dst_ip": "10.0.0.2", "dst_port": 8080, "protocol": "http"},
+        {"timestamp": now, "dst_ip": "10.0.0.3", "dst_port": 3389, "protocol": "tcp"},
+    ]
+
+    results = await processor.process_raw_batch(raw_events, collector="syslog")
+
+    assert [result.is_anomaly for result in results] == [True, False, True]
+    records = processor.repository.list_recent()
+    assert len(records) == 2
+    assert records[0].detected_at == records[1].detected_at
+
+
+@pytest.mark.asyncio
+async def test_pipeline_processor_runs_noop_enricher_subclasses():
+    class TagEnricher(NoOpEnricher):
+        async def enrich(self, event: Event) -> EnrichmentResult:
+            return EnrichmentResult(event=event, metadata={"tag": 1})
+
+    processor = PipelineProcessor(detector=PortScanHeuristicDetector(), enricher=TagEnricher())
+    raw_event = {
+        "timestamp": datetime.utcnow().isoformat(),
+        "dst_ip": "10.0.0.1",
+        "dst_port": 8080,
+        "protocol": "http",
+    }
+
+    result = await processor.process_raw_event(raw_event, collector="syslog")
+
+    assert result.event.payload["enrichment"] == {"tag": 1}
@@ -0,0 +1,106 @@
+import asyncio
+from datetime import datetime
+
+import orjson
+import pytest
+
+from anomaly_detector.config import get_settings
+from anomaly_detector.pipeline.models import Event
+from anomaly_detector.pipeline.queue import (
+    InMemoryQueueProducer,
+    KafkaQueueProducer,
+    get_queue_producer,
+    reset_queue_producer,
+)
+
+
+def test_get_queue_producer_is_cached(monkeypatch) -> None:
+    monkeypatch.setattr(get_settings(), "queue_backend", "memory")
+    reset_queue_producer()
+    try:
+        producer = get_queue_producer()
+        assert isinstance(producer, InMemoryQueueProducer)
+        assert get_queue_producer() is producer
+    finally:
+        reset_queue_producer()
+
+
+class _StubKafkaProducer:
+    """Stand-in for AIOKafkaProducer that fails chosen send() calls or deliveries."""
+
+    def __init__(self, **_: object) -> None:
+        self.delivered: list[bytes] = []
+        self.fail_send_calls: set[int] = set()
+        self.fail_delivery_calls: set[int] = set()
+        self._calls = 0
+        self._inflight: list[tuple[int, bytes, asyncio.Future[None]]] = []
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    async def send(self, topic: str, value: bytes) -> asyncio.Future[None]:
+        self._calls += 1
+        if self._calls in self.fail_send_calls:
+            raise RuntimeError("buffer full")
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._inflight.append((self._calls, value, future))
+        return future
+
+    async def flush(self) -> None:
+        for call, value, future in self._inflight:
+            if call in self.fail_delivery_calls:
+                future.set_exception(RuntimeError("delivery failed"))
+            else:
+                self.delivered.append(value)
+                future.set_result(None)
+        self._inflight.clear()
+
+
+def _make_kafka_producer(monkeypatch) -> tuple[KafkaQueueProducer, _StubKafkaProducer]:
+    monkeypatch.setattr("aiokafka.AIOKafkaProducer", _StubKafkaProducer)
+    monkeypatch.setattr(asyncio, "sleep", _no_sleep)
+    producer = KafkaQueueProducer(topic="events")
+    return producer, producer._producer  # type: ignore[return-value]
+
+
+async def _no_sleep(_: float) -> None:
+    return None
+
+
+def _events(count: int) -> list[Event]:
+    return [
+        Event(
+            timestamp=datetime(2024, 1, 1),
+            source_ip=None,
+            destination_ip=None,
+            source_port=None,
+            destination_port=port,
+            protocol="tcp",
+        )
+        for port in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_kafka_retry_skips_records_already_enqueued(monkeypatch) -> None:
+    producer, stub = _make_kafka_producer(monkeypatch)
+    stub.fail_send_calls = {3}
+
+    await producer.send_batch(_events(4))
+
+    ports = [orjson.loads(value)["destination_port"] for value in stub.delivered]
+    assert sorted(ports) == [0, 1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_kafka_retry_resends_only_failed_deliveries(monkeypatch) -> None:
+    producer, stub = _make_kafka_producer(monkeypatch)
+    stub.fail_delivery_calls = {2}
+
+    await producer.send_batch(_events(3))
+
+    ports = [orjson.loads(value)["destination_port"] for value in stub.delivered]
+    assert ports == [0, 2, 1]
@@ -0,0 +1,110 @@
+import asyncio
+from datetime import datetime
+
+import orjson
+import pytest
+
+from anomaly_detector.pipeline.models import Event
+from anomaly_detector.storage.repository import InMemoryAnomalyRepository
+
+
+def make_event() -> Event:
+    return Event(
+        timestamp=datetime.utcnow(),
+        source_ip=None,
+        destination_ip=None,
+        source_port=None,
+        destination_port=22,
+        protocol="tcp",
+        payload={},
+    )
+
+
+@pytest.mark.asyncio
+async def test_wait_for_change_wakes_on_add() -> None:
+    repo = InMemoryAnomalyRepository()
+    version = repo.version
+
+    waiter = asyncio.ensure_future(repo.wait_for_change(version))
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    repo.add(score=0.9, description="Sensitive service targeted", event=make_event())
+
+    new_version = await asyncio.wait_for(waiter, timeout=1)
+    assert new_version == repo.version
+    assert new_version != version
+
+
+def test_list_recent_json_returns_newest_first() -> None:
+    repo = InMemoryAnomalyRepository()
+    repo.add(score=0.7, description="first", event=make_event())
+    repo.add(score=0.9, description="second", event=make_event())
+
+    data = orjson.loads(repo.list_recent_json(limit=1))
+    assert [item["description"] for item in data] == ["second"]
+    assert data[0]["event"]["destination_port"] == 22
+    assert orjson.loads(repo.list_recent_json(limit=10))[1]["description"] == "first"
+
+
+def test_recent_json_buffer_is_bounded() -> None:
+    repo = InMemoryAnomalyRepository(recent_json_size=2)
+    for index in range(3):
+        repo.add(score=0.8, description=f"anomaly-{index}", event=make_event())
+
+    data = orjson.loads(repo.list_recent_json(limit=10))
+    assert [item["description"] for item in data] == ["anomaly-2", "anomaly-1"]
+
+
+def test_repository_keeps_only_max_items() -> None:
+    repo = InMemoryAnomalyRepository(max_items=2)
+    for index in range(3):
+        repo.add(score=0.8, description=f"anomaly-{index}", event=make_event())
+
+    assert [record.description for record in repo.list_recent(limit=10)] == [
+        "anomaly-2",
+        "anomaly-1",
+    ]
+
+
+def test_add_accepts_payloads_orjson_rejects() -> None:
+    repo = InMemoryAnomalyRepository()
+    event = make_event()
+    event.payload = {1: "x", "big": 2**70}
+
+    record = repo.add(score=0.8, description="odd payload", event=event)
+
+    data = orjson.loads(repo.list_recent_json(limit=1))
+    assert data[0]["id"] == record.id == 1
+    assert data[0]["event"]["payload"] == {"1": "x", "big": 2**70}
+    assert repo.version == 1
+
+
+def test_cached_json_matches_pydantic_payload_shape() -> None:
+    repo = InMemoryAnomalyRepository()
+    event = make_event()
+    event.payload = {"ports": {22}, "banner": b"ab", "nested": {"ip": event.timestamp}}
+    event.tags = {"scan", "ssh"}
+
+    repo.add(score=0.8, description="shape", event=event)
+
+    data = orjson.loads(repo.list_recent_json(limit=1))[0]["event"]
+    assert data["payload"] == {
+        "ports": [22],
+        "banner": "ab",
+        "nested": {"ip": event.timestamp.isoformat()},
+    }
+    assert data["tags"] == ["scan", "ssh"]
+
+
+def test_add_stringifies_keys_and_keeps_iso_datetimes_in_fallback() -> None:
+    repo = InMemoryAnomalyRepository()
+    event = make_event()
+    seen = datetime(2024, 1, 1, 12, 30)
+    event.payload = {(1, 2): "x", "big": 2**70, "seen": seen}
+
+    repo.add(score=0.8, description="tuple keys", event=event)
+
+    payload = orjson.loads(repo.list_recent_json(limit=1))[0]["event"]["payload"]
+    assert payload == {"(1, 2)": "x", "big": 2**70, "seen": seen.isoformat()}
+    assert len(repo.list_recent()) == 1